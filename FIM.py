@@ -10,9 +10,13 @@
 # Made by IEJ
 
 import os
+import re
 import hashlib
 import sqlite3
 import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
@@ -20,31 +24,61 @@ from rich.console import Console
 import platform
 import getpass
 
+# Optional faster hash algorithm, only needed when "blake3" is selected
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 # Pdf Exporting Imports
-from exporters import export_to_csv, export_to_pdf, export_logs
+from exporters import export_both, export_logs
 
 console = Console()
 
+# Hash algorithms FileMonitor can use; sha256 is the default
+HASH_ALGORITHMS = ("sha256", "blake3")
 
-def get_key():
-    """Get a single keypress from the user"""
-    if platform.system() == "Windows":
-        import msvcrt
+# Read size used when hashing files, large enough to amortize per-call overhead
+HASH_CHUNK_SIZE = 1 << 20
+
+# Only files larger than this get a sequential-readahead hint before hashing;
+# anything smaller is read in one or two HASH_CHUNK_SIZE reads anyway
+FADVISE_THRESHOLD = 1 << 20
+
+# Number of baseline rows written to the database per transaction
+BASELINE_BATCH_SIZE = 1000
 
-        return msvcrt.getch().decode("utf-8").lower()
-    else:
-        import sys
-        import tty
-        import termios
 
+_IS_WINDOWS = platform.system() == "Windows"
+
+if _IS_WINDOWS:
+    import msvcrt
+
+    def _getch():
+        return msvcrt.getch().decode("utf-8")
+
+else:
+    import sys
+    import tty
+    import termios
+
+    def _getch():
         fd = sys.stdin.fileno()
         old_settings = termios.tcgetattr(fd)
         try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1).lower()
+            tty.setraw(fd)
+            return sys.stdin.read(1)
         finally:
             termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-        return ch
+
+
+def get_key():
+    """Get a single keypress from the user"""
+    return _getch().lower()
+
+
+# Windows drive-letter path such as C:\Users\..., split into drive and remainder
+_WIN_DRIVE = re.compile(r"([A-Za-z]):(.*)", re.DOTALL)
 
 
 def clean_path(path):
@@ -52,41 +86,88 @@ def clean_path(path):
     path = path.strip().strip('"').strip("'").strip()
 
     if os.name == "nt":  # Windows
-        # Normalize slashes to Windows style and resolve any relative components
-        path = os.path.normpath(path.replace("/", "\\"))
-        # Ensure proper absolute path
-        return os.path.abspath(path)
-    else:  # Unix/WSL
-        # Check if this is a Windows path (e.g., C:\, D:\, etc.)
-        if len(path) > 1 and path[0].isalpha() and path[1] == ":":
-            # Convert Windows path to WSL
-            drive_letter = path[0].lower()
-            # Remove drive letter and colon, normalize slashes
-            win_path = path[2:].replace("\\", "/").lstrip("/")
-            path = f"/mnt/{drive_letter}/{win_path}"
-
-        # Normalize the path for Unix systems
-        return os.path.abspath(path)
+        # abspath normalizes slashes and resolves relative components itself
+        return os.path.abspath(path.replace("/", "\\"))
+
+    # Unix/WSL: convert Windows drive paths (e.g., C:\, D:\) to the WSL mount
+    match = _WIN_DRIVE.fullmatch(path)
+    if match:
+        win_path = match[2].replace("\\", "/").lstrip("/")
+        path = f"/mnt/{match[1].lower()}/{win_path}"
+    return os.path.abspath(path)
+
+
+def _scan_files(top):
+    """Yield (path, stat_result) for every file below top"""
+    # os.scandir reuses the directory listing's entry data instead of stat-ing
+    # each path again like os.walk + os.stat; symlinked directories are skipped
+    pending = [top]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue  # Unreadable directory, os.walk skips these too
+        for entry in entries:
+            try:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        pending.append(entry.path)
+                    continue
+                yield entry.path, entry.stat()
+            except OSError as e:
+                console.print(f"[red]Error reading {entry.path}: {e}[/red]")
+
+
+def _encode_meta(mode, mtime):
+    """Return the (permissions, last_modified) strings stored for a file"""
+    # Same 3-digit octal string as str(oct(mode)[-3:]), without the temporaries
+    return "%03o" % (mode & 0o777), datetime.fromtimestamp(mtime).isoformat()
 
 
 class Database:
     def __init__(self, db_file="file_hashes.db"):
         self.db_file = db_file
+        # One connection is shared by the baseline scan and the watchdog
+        # observer thread, so every use of it goes through this lock
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(
+            db_file, check_same_thread=False, isolation_level=None
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA mmap_size=268435456")
         self.init_database()
 
     def init_database(self):
-        with sqlite3.connect(self.db_file) as conn:
-            cursor = conn.cursor()
+        with self.lock:
+            cursor = self.conn.cursor()
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS file_hashes (
                     file_path TEXT PRIMARY KEY,
-                    hash TEXT,
+                    hash BLOB,
                     last_modified TEXT,
-                    permissions TEXT
+                    permissions TEXT,
+                    size INTEGER
                 )
             """
             )
+            # Databases created before the size column existed need it added
+            cursor.execute("PRAGMA table_info(file_hashes)")
+            if "size" not in [column[1] for column in cursor.fetchall()]:
+                cursor.execute("ALTER TABLE file_hashes ADD COLUMN size INTEGER")
+            # Older databases stored hex digests; convert them to raw bytes
+            cursor.execute(
+                "SELECT file_path, hash FROM file_hashes WHERE typeof(hash) = 'text'"
+            )
+            hex_rows = cursor.fetchall()
+            if hex_rows:
+                cursor.executemany(
+                    "UPDATE file_hashes SET hash = ? WHERE file_path = ?",
+                    [(bytes.fromhex(h), path) for path, h in hex_rows],
+                )
             cursor.execute(
                 """
                 CREATE TABLE IF NOT EXISTS alerts (
@@ -97,42 +178,127 @@ class Database:
                 )
             """
             )
+            cursor.execute(
+                """
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """
+            )
+            # Lets get_all_alerts' ORDER BY walk the index instead of sorting
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_alerts_ts ON alerts(timestamp)"
+            )
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self.lock:
+            self.conn.close()
 
     def get_all_alerts(self):
         """Retrieve all alerts from the database"""
-        with sqlite3.connect(self.db_file) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with self.lock:
+            return self.conn.execute(
                 "SELECT timestamp, file_path, event_type, details FROM alerts ORDER BY timestamp"
-            )
-            return cursor.fetchall()
+            ).fetchall()
 
-    def store_file_hash(self, file_path, file_hash, last_modified, permissions):
-        with sqlite3.connect(self.db_file) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+    def get_all_alerts_iter(self, batch_size=10000):
+        """Yield alerts in timestamp order as lists of up to batch_size rows"""
+        with self.lock:
+            cursor = self.conn.execute(
+                "SELECT timestamp, file_path, event_type, details FROM alerts ORDER BY timestamp"
+            )
+        while True:
+            # Only hold the lock per batch so the consumer never runs under it
+            with self.lock:
+                rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            yield rows
+
+    def store_file_hash(self, file_path, file_hash, last_modified, permissions, size):
+        with self.lock:
+            self.conn.execute(
                 """
                 INSERT OR REPLACE INTO file_hashes 
-                (file_path, hash, last_modified, permissions) 
-                VALUES (?, ?, ?, ?)
+                (file_path, hash, last_modified, permissions, size) 
+                VALUES (?, ?, ?, ?, ?)
             """,
-                (file_path, file_hash, last_modified, permissions),
+                (file_path, file_hash, last_modified, permissions, size),
             )
 
+    def store_file_hashes_bulk(self, rows):
+        """Store many (file_path, hash, last_modified, permissions, size) rows at once"""
+        with self.lock:
+            # The connection autocommits, so group the rows explicitly
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                self.conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO file_hashes 
+                    (file_path, hash, last_modified, permissions, size) 
+                    VALUES (?, ?, ?, ?, ?)
+                """,
+                    rows,
+                )
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+            self.conn.execute("COMMIT")
+
     def get_file_hash(self, file_path):
-        with sqlite3.connect(self.db_file) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with self.lock:
+            result = self.conn.execute(
                 "SELECT hash FROM file_hashes WHERE file_path = ?", (file_path,)
+            ).fetchone()
+            return result[0] if result else None
+
+    def get_file_record(self, file_path):
+        """Return (hash, last_modified, size) for a file, or None if unknown"""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT hash, last_modified, size FROM file_hashes WHERE file_path = ?",
+                (file_path,),
+            ).fetchone()
+
+    def get_all_file_records(self):
+        """Return (file_path, hash, last_modified, size) for every stored file"""
+        with self.lock:
+            return self.conn.execute(
+                "SELECT file_path, hash, last_modified, size FROM file_hashes"
+            ).fetchall()
+
+    def delete_file_hashes(self, file_paths):
+        """Remove the stored hashes of the given files"""
+        with self.lock:
+            self.conn.executemany(
+                "DELETE FROM file_hashes WHERE file_path = ?",
+                [(file_path,) for file_path in file_paths],
             )
-            result = cursor.fetchone()
+
+    def clear_file_hashes(self):
+        """Remove every stored file hash"""
+        with self.lock:
+            self.conn.execute("DELETE FROM file_hashes")
+
+    def get_meta(self, key):
+        with self.lock:
+            result = self.conn.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
             return result[0] if result else None
 
+    def set_meta(self, key, value):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+            )
+
     def log_alert(self, file_path, event_type, details):
-        with sqlite3.connect(self.db_file) as conn:
-            cursor = conn.cursor()
-            timestamp = datetime.now().isoformat()
-            cursor.execute(
+        timestamp = datetime.now().isoformat()
+        with self.lock:
+            self.conn.execute(
                 """
                 INSERT INTO alerts (timestamp, file_path, event_type, details)
                 VALUES (?, ?, ?, ?)
@@ -142,44 +308,172 @@ class Database:
 
 
 class FileMonitor:
-    def __init__(self, path_to_monitor):
+    def __init__(self, path_to_monitor, hash_algo="sha256"):
+        if hash_algo not in HASH_ALGORITHMS:
+            raise ValueError(f"Unsupported hash algorithm: {hash_algo}")
+        if hash_algo == "blake3" and blake3 is None:
+            raise ValueError("BLAKE3 hashing requires the blake3 package")
+
         self.path_to_monitor = path_to_monitor
+        self.hash_algo = hash_algo
         self.db = Database()
         self.baseline_hashes = {}
 
-    def calculate_file_hash(self, file_path):
-        """Calculate SHA-256 hash of a file."""
-        sha256_hash = hashlib.sha256()
+        # Digests from different algorithms can't be compared, so drop the old
+        # baseline when the algorithm changes (databases without the setting
+        # predate it and hold SHA-256 digests)
+        if (self.db.get_meta("hash_algo") or "sha256") != hash_algo:
+            self.db.clear_file_hashes()
+        self.db.set_meta("hash_algo", hash_algo)
+
+    def calculate_file_hash(self, file_path, size=None):
+        """Calculate the raw 32-byte digest of a file with the chosen algorithm."""
+        if self.hash_algo == "blake3":
+            # blake3 spreads large update calls across threads by itself
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+        else:
+            # hashlib's SHA-256 is backed by OpenSSL, which already dispatches
+            # to the SHA-NI instructions on CPUs that support them
+            hasher = hashlib.sha256()
         try:
-            with open(file_path, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+            # Unbuffered reads straight into one reused buffer avoid both the
+            # BufferedReader copy and a new bytes object per chunk
+            with open(file_path, "rb", buffering=0) as f:
+                # Large files are read front to back, so ask for more readahead;
+                # callers pass the size they already have from stat
+                if (
+                    size is not None
+                    and size > FADVISE_THRESHOLD
+                    and hasattr(os, "posix_fadvise")
+                ):
+                    try:
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    except OSError:
+                        pass
+                buffer = bytearray(HASH_CHUNK_SIZE)
+                view = memoryview(buffer)
+                while True:
+                    n = f.readinto(buffer)
+                    if not n:
+                        break
+                    hasher.update(view[:n])
+            return hasher.digest()
         except Exception as e:
             console.print(f"[red]Error calculating hash for {file_path}: {e}[/red]")
             return None
 
+    def _baseline_row(self, file_path, stats):
+        """Hash one file and build its file_hashes row, or None on failure."""
+        file_hash = self.calculate_file_hash(file_path, stats.st_size)
+        if not file_hash:
+            return None
+        permissions, last_modified = _encode_meta(stats.st_mode, stats.st_mtime)
+        return (file_path, file_hash, last_modified, permissions, stats.st_size)
+
     def establish_baseline(self):
-        """Create initial baseline of files and their hashes."""
+        """Create the baseline of files and hashes, reporting offline changes."""
         console.print("[yellow]Establishing baseline...[/yellow]")
-        for root, _, files in os.walk(self.path_to_monitor):
-            for file in files:
-                file_path = os.path.join(root, file)
-                file_hash = self.calculate_file_hash(file_path)
-                if file_hash:
-                    stats = os.stat(file_path)
-                    self.db.store_file_hash(
-                        file_path,
-                        file_hash,
-                        datetime.fromtimestamp(stats.st_mtime).isoformat(),
-                        str(oct(stats.st_mode)[-3:]),
-                    )
+
+        # Files whose mtime and size still match the stored row were hashed by
+        # an earlier run, so only new or changed files need to be read again
+        # (file_path -> (hash, last_modified, size))
+        known = {row[0]: row[1:] for row in self.db.get_all_file_records()}
+
+        # hashlib releases the GIL while hashing, so a thread pool keeps several
+        # files in flight at once. Only a bounded number of hashes are queued
+        # ahead of the writer so memory stays flat on huge trees.
+        workers = os.cpu_count() or 1
+        max_pending = 4 * workers
+        rows = []
+        modified = []
+        pending = deque()
+
+        def collect():
+            future, old_hash = pending.popleft()
+            row = future.result()
+            if not row:
+                return
+            rows.append(row)
+            # A stored hash that no longer matches means the file changed
+            # while nothing was monitoring it
+            if old_hash is not None and old_hash != row[1]:
+                modified.append((row[0], old_hash, row[1]))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Hash while the walk is still running, in directory order
+            for file_path, stats in _scan_files(self.path_to_monitor):
+                # Whatever is left in known afterwards was not found on disk
+                stored = known.pop(file_path, None)
+                last_modified = _encode_meta(stats.st_mode, stats.st_mtime)[1]
+                if stored and stored[1:] == (last_modified, stats.st_size):
+                    continue
+                future = executor.submit(self._baseline_row, file_path, stats)
+                pending.append((future, stored[0] if stored else None))
+                if len(pending) < max_pending:
+                    continue
+                collect()
+                # Flush in batches so one transaction covers many files
+                if len(rows) >= BASELINE_BATCH_SIZE:
+                    self.db.store_file_hashes_bulk(rows)
+                    rows.clear()
+
+            while pending:
+                collect()
+
+        if rows:
+            self.db.store_file_hashes_bulk(rows)
+
+        # The database may also hold files from other monitored directories;
+        # lexists keeps files in directories the walk couldn't read from being
+        # reported as deleted
+        prefix = os.path.join(self.path_to_monitor, "")
+        missing = [
+            file_path
+            for file_path in known
+            if file_path.startswith(prefix) and not os.path.lexists(file_path)
+        ]
+        self._report_offline_changes(missing, modified)
         console.print("[green]Baseline established![/green]")
 
+    def _report_offline_changes(self, missing, modified):
+        """Log alerts for files that changed while nothing was monitoring them."""
+        if not missing and not modified:
+            return
+        username = getpass.getuser()  # Get the current user
+
+        for file_path in missing:
+            console.print(
+                f"[red]File DELETED while not monitored: {file_path} (User: {username})[/red]"
+            )
+            self.db.log_alert(
+                file_path,
+                "DELETED",
+                f"User: {username}, File deleted while not monitored",
+            )
+        # Forget deleted files so the next start doesn't report them again
+        self.db.delete_file_hashes(missing)
+
+        for file_path, old_hash, new_hash in modified:
+            console.print(
+                f"[blue]File MODIFIED while not monitored: {file_path} (User: {username})[/blue]"
+            )
+            self.db.log_alert(
+                file_path,
+                "MODIFIED",
+                f"User: {username}, Hash changed ({self.hash_algo}): "
+                f"{old_hash.hex()} -> {new_hash.hex()}",
+            )
+
 
 class FileEventHandler(FileSystemEventHandler):
     def __init__(self, monitor):
         self.monitor = monitor
+        # Bound once here rather than resolved through monitor.db on every event
+        self._log_alert = monitor.db.log_alert
+        self._get_record = monitor.db.get_file_record
+        self._store_hash = monitor.db.store_file_hash
+        self._delete_hashes = monitor.db.delete_file_hashes
+        self._calc = monitor.calculate_file_hash
         super().__init__()
 
     def format_path(self, path):
@@ -211,19 +505,19 @@ class FileEventHandler(FileSystemEventHandler):
             f"File RENAMED: {src_path_clean} -> {dest_path_clean} (User: {username})"
         )
         console.print(f"[yellow]{alert_msg}[/yellow]")
-        self.monitor.db.log_alert(
+        self._log_alert(
             dest_path, "RENAMED", f"User: {username}, Renamed from: {src_path}"
         )
+        # The old path is gone, so the startup check must not report it deleted
+        self._delete_hashes([src_path])
 
         # Update the database with the new file path
         if os.path.exists(dest_path):
-            new_hash = self.monitor.calculate_file_hash(dest_path)
             stats = os.stat(dest_path)
-            self.monitor.db.store_file_hash(
-                dest_path,
-                new_hash,
-                datetime.fromtimestamp(stats.st_mtime).isoformat(),
-                str(oct(stats.st_mode)[-3:]),
+            new_hash = self._calc(dest_path, stats.st_size)
+            permissions, last_modified = _encode_meta(stats.st_mode, stats.st_mtime)
+            self._store_hash(
+                dest_path, new_hash, last_modified, permissions, stats.st_size
             )
 
     def _handle_file_event(self, file_path, event_type):
@@ -231,8 +525,21 @@ class FileEventHandler(FileSystemEventHandler):
         username = getpass.getuser()  # Get the current user
 
         if event_type != "DELETED":
-            new_hash = self.monitor.calculate_file_hash(file_path)
-            old_hash = self.monitor.db.get_file_hash(file_path)
+            try:
+                stats = os.stat(file_path)
+            except OSError:
+                return  # File disappeared before it could be inspected
+
+            permissions, last_modified = _encode_meta(stats.st_mode, stats.st_mtime)
+            record = self._get_record(file_path)
+            old_hash = record[0] if record else None
+
+            # Unchanged mtime and size mean the content has not been rewritten,
+            # so the (expensive) full read and re-hash can be skipped
+            if old_hash is not None and record[1:] == (last_modified, stats.st_size):
+                return
+
+            new_hash = self._calc(file_path, stats.st_size)
 
             if old_hash != new_hash:
                 alert_msg = f"File {event_type}: {file_path_clean} (User: {username})"
@@ -241,26 +548,29 @@ class FileEventHandler(FileSystemEventHandler):
                 elif event_type == "MODIFIED":
                     console.print(f"[blue]{alert_msg}[/blue]")
 
-                self.monitor.db.log_alert(
+                # Digests are stored as bytes but reported as hex
+                old_hex = old_hash.hex() if old_hash else None
+                new_hex = new_hash.hex() if new_hash else None
+                self._log_alert(
                     file_path,
                     event_type,
-                    f"User: {username}, Hash changed: {old_hash} -> {new_hash}",
+                    f"User: {username}, Hash changed ({self.monitor.hash_algo}): "
+                    f"{old_hex} -> {new_hex}",
                 )
 
-                if event_type != "DELETED":
-                    stats = os.stat(file_path)
-                    self.monitor.db.store_file_hash(
-                        file_path,
-                        new_hash,
-                        datetime.fromtimestamp(stats.st_mtime).isoformat(),
-                        str(oct(stats.st_mode)[-3:]),
-                    )
+            # Also refresh the stored metadata for touch-only changes so the
+            # next event for this file can take the fast path above. A failed
+            # hash is not stored, so the next event tries again.
+            if new_hash is not None:
+                self._store_hash(
+                    file_path, new_hash, last_modified, permissions, stats.st_size
+                )
         else:
             alert_msg = f"File {event_type}: {file_path_clean} (User: {username})"
             console.print(f"[red]{alert_msg}[/red]")
-            self.monitor.db.log_alert(
-                file_path, event_type, f"User: {username}, File deleted"
-            )
+            self._log_alert(file_path, event_type, f"User: {username}, File deleted")
+            # Already reported, so the startup check must not report it again
+            self._delete_hashes([file_path])
 
 
 def main():
@@ -270,7 +580,16 @@ def main():
             console.print("[red]Directory does not exist![/red]")
             return
 
-        monitor = FileMonitor(path_to_monitor)
+        hash_algo = "sha256"
+        if blake3 is not None:
+            hash_algo = (
+                input("Hash algorithm (sha256/blake3, default sha256): ")
+                .lower()
+                .strip()
+                or "sha256"
+            )
+
+        monitor = FileMonitor(path_to_monitor, hash_algo)
         monitor.establish_baseline()
 
         event_handler = FileEventHandler(monitor)
@@ -283,10 +602,20 @@ def main():
             f"[green]Started monitoring at {start_time.strftime('%Y-%m-%d %H:%M:%S')}. Press 'q' to stop...[/green]"
         )
 
-        while True:
-            if get_key() == "q":
-                break
-            time.sleep(0.1)  # Prevent high CPU usage
+        # Read keys on a background thread so the main thread just blocks
+        # until 'q' is pressed instead of polling
+        stop_event = threading.Event()
+
+        def wait_for_quit():
+            try:
+                while get_key() != "q":
+                    pass
+            finally:
+                # Also release main if reading keys fails (e.g. stdin not a tty)
+                stop_event.set()
+
+        threading.Thread(target=wait_for_quit, daemon=True).start()
+        stop_event.wait()
 
         # Countdown starts only after 'q' is pressed
         console.print("[yellow]Stopping monitor in 3 seconds...[/yellow]")
@@ -316,8 +645,7 @@ def main():
                 export_logs(monitor)
             elif export_choice in ["b", "both"]:
                 console.print("[yellow]Exporting logs as both CSV and PDF...[/yellow]")
-                export_to_csv(monitor)
-                export_to_pdf(monitor)
+                export_both(monitor)
 
         console.print("[green]Monitoring stopped successfully.[/green]")
 
@@ -336,6 +664,10 @@ def main():
             observer.join()
         except Exception:
             pass
+        try:
+            monitor.db.close()
+        except Exception:
+            pass
 
 
 if __name__ == "__main__":
@@ -1,7 +1,11 @@
 # exporters.py
 
 import os
+import re
 import csv
+from io import BytesIO, TextIOWrapper
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 from rich.console import Console
 from reportlab.lib import colors
@@ -9,6 +13,7 @@ from reportlab.lib.pagesizes import letter, landscape
 from reportlab.platypus import (
     SimpleDocTemplate,
     Table,
+    LongTable,
     TableStyle,
     Paragraph,
     Spacer,
@@ -17,19 +22,160 @@ from reportlab.platypus import (
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.graphics.shapes import Drawing
-from reportlab.graphics.charts.piecharts import Pie
-from reportlab.graphics.charts.barcharts import VerticalBarChart
-from reportlab.graphics.charts.legends import Legend
-from reportlab.graphics.charts.textlabels import Label
-from reportlab.graphics.widgets.markers import makeMarker
-from reportlab.graphics import renderPDF
-from collections import defaultdict
+from collections import Counter
+from operator import attrgetter
 from reportlab.pdfgen import canvas
-from textwrap import wrap
 
 console = Console()
 
+# Resolution charts are rasterized at before being embedded in the PDF report
+CHART_DPI = 144
+
+# Maximum alerts per detail table in the PDF report
+DETAIL_TABLE_CHUNK_ROWS = 2000
+
+# Pulls the user and, for content changes, the hash algorithm and the old/new
+# hashes out of an alert's details string in a single scan
+_DETAIL_RE = re.compile(
+    r"User:\s*([^,]+)(?:.*?Hash changed(?:\s*\((\w+)\))?:\s*(\S+)\s*->\s*(\S+))?",
+    re.DOTALL,
+)
+
+# Display names for the algorithms recorded in alert details; alerts from before
+# the algorithm was recorded hold SHA-256 digests
+_HASH_NAMES = {"sha256": "SHA-256", "blake3": "BLAKE3"}
+
+# Splits a hex digest into 32-character lines for the detail table
+_HASH_LINE_RE = re.compile(r".{1,32}", re.DOTALL)
+
+# Table styles are parsed once per process and shared by every export
+_SUMMARY_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F8F9FA")),
+        ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#2C3E50")),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, -1), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 11),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+        ("TOPPADDING", (0, 0), (-1, -1), 12),
+        ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#E9ECEF")),
+        (
+            "ROWBACKGROUNDS",
+            (0, 0),
+            (-1, -1),
+            [colors.HexColor("#FFFFFF"), colors.HexColor("#F8F9FA")],
+        ),
+        ("ALIGN", (1, 0), (1, -1), "RIGHT"),
+    ]
+)
+
+_CHART_STYLE = TableStyle(
+    [
+        ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+    ]
+)
+
+_DETAIL_STYLE = TableStyle(
+    [
+        # Header
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2C3E50")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
+        # Alternating rows
+        (
+            "ROWBACKGROUNDS",
+            (0, 1),
+            (-1, -1),
+            [colors.HexColor("#FFFFFF"), colors.HexColor("#F8F9FA")],
+        ),
+        ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#E9ECEF")),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+        ("TOPPADDING", (0, 0), (-1, 0), 12),
+    ]
+)
+
+
+@lru_cache(maxsize=None)
+def _report_styles():
+    """Build the report's paragraph styles once and reuse them for every export"""
+    styles = getSampleStyleSheet()
+    styles.add(
+        ParagraphStyle(
+            "SectionHeader",
+            parent=styles["Heading2"],
+            fontSize=14,
+            spaceAfter=10,
+            textColor=colors.HexColor("#2C3E50"),
+        )
+    )
+
+    styles.add(
+        ParagraphStyle(
+            "MainTitle",
+            parent=styles["Title"],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=colors.HexColor("#2C3E50"),
+            alignment=1,
+        )
+    )
+
+    styles.add(
+        ParagraphStyle(
+            "SubTitle",
+            parent=styles["Heading2"],
+            fontSize=16,
+            spaceBefore=20,
+            spaceAfter=20,
+            textColor=colors.HexColor("#34495E"),
+            alignment=1,
+        )
+    )
+
+    styles.add(
+        ParagraphStyle(
+            "TimeStamp",
+            parent=styles["Normal"],
+            fontSize=10,
+            textColor=colors.HexColor("#7F8C8D"),
+            alignment=1,
+        )
+    )
+    return styles
+
+
+def _rasterize_chart(drawing):
+    """Render a chart Drawing to an embedded PNG Image, or return it unchanged"""
+    # A bitmap is cheap to lay out, while a live Drawing is re-laid out whenever
+    # the enclosing table is measured. Without a raster backend (rlPyCairo or
+    # reportlab's _renderPM) the vector drawing is used as before.
+    renderPM = _chart_renderer()
+    if renderPM is None:
+        return drawing
+    png = renderPM.drawToString(drawing, fmt="PNG", dpi=CHART_DPI)
+    return Image(BytesIO(png), width=drawing.width, height=drawing.height)
+
+
+@lru_cache(maxsize=None)
+def _chart_renderer():
+    """Return reportlab's renderPM module, or None if it has no raster backend"""
+    try:
+        from reportlab.graphics import renderPM
+    except ImportError:  # Older reportlab without the _renderPM extension
+        return None
+    # Newer reportlab only loads the backend on first use; probe it here so
+    # real rendering errors are not mistaken for a missing backend
+    if hasattr(renderPM, "_getPMBackend"):
+        try:
+            renderPM._getPMBackend()
+        except renderPM.RenderPMError:
+            return None
+    return renderPM
+
 
 def get_export_path(extension, base_dir=None):
     """Generate export path with timestamp"""
@@ -42,16 +188,28 @@ def get_export_path(extension, base_dir=None):
 
 
 def export_to_csv(monitor, export_path=None):
+    # Stream fixed-size batches from the database so memory use stays flat
+    return _write_csv(monitor.db.get_all_alerts_iter(), export_path)
+
+
+def _write_csv(alert_batches, export_path=None):
+    """Write an iterable of alert row batches to a CSV file"""
     try:
         if not export_path:
             export_path = get_export_path("csv")
 
-        alerts = monitor.db.get_all_alerts()
-
-        with open(export_path, "w", newline="", encoding="utf-8") as csvfile:
+        # A 1 MiB binary buffer turns many small writes into a few large ones,
+        # and write_through=False lets the text layer batch before handing off
+        with TextIOWrapper(
+            open(export_path, "wb", buffering=1 << 20),
+            encoding="utf-8",
+            newline="",
+            write_through=False,
+        ) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(["Timestamp", "File Path", "Event Type", "Details"])
-            writer.writerows(alerts)
+            for batch in alert_batches:
+                writer.writerows(batch)
 
         console.print(f"[green]Logs exported successfully to: {export_path}[/green]")
         return True
@@ -64,10 +222,30 @@ def export_to_pdf(monitor, export_path=None):
     """Export alerts to a detailed PDF report with summary statistics and visualizations."""
     try:
         alerts = monitor.db.get_all_alerts()
+    except Exception as e:
+        console.print(f"[red]Error exporting logs to PDF: {str(e)}[/red]")
+        return False
+    return _write_pdf(alerts, export_path)
+
+
+def _write_pdf(alerts, export_path=None):
+    """Build the PDF report from an already-fetched list of alerts"""
+    # Module-level and plain data in, so export_both can run it in a worker process
+    try:
+        # reportlab.graphics is slow to import, so only pay for it when charting
+        from reportlab.graphics.shapes import Drawing
+        from reportlab.graphics.charts.piecharts import Pie
+        from reportlab.graphics.charts.barcharts import VerticalBarChart
+
         if not alerts:
             console.print("[red]No alerts to export.[/red]")
             return False
 
+        # Split the rows into columns once so each pass below walks just the
+        # column it needs, and parse every timestamp a single time
+        raw_timestamps, file_paths, event_types, details = zip(*alerts)
+        timestamps = [datetime.fromisoformat(ts) for ts in raw_timestamps]
+
         # Enhanced metadata
         pdf_metadata = {
             "Title": "File Integrity Monitor Report",
@@ -89,75 +267,35 @@ def export_to_pdf(monitor, export_path=None):
             bottomMargin=50,
         )
 
-        # Styles
-        styles = getSampleStyleSheet()
-        styles.add(
-            ParagraphStyle(
-                "SectionHeader",
-                parent=styles["Heading2"],
-                fontSize=14,
-                spaceAfter=10,
-                textColor=colors.HexColor("#2C3E50"),
-            )
-        )
-
-        styles.add(
-            ParagraphStyle(
-                "MainTitle",
-                parent=styles["Title"],
-                fontSize=24,
-                spaceAfter=30,
-                textColor=colors.HexColor("#2C3E50"),
-                alignment=1,
-            )
-        )
-
-        styles.add(
-            ParagraphStyle(
-                "SubTitle",
-                parent=styles["Heading2"],
-                fontSize=16,
-                spaceBefore=20,
-                spaceAfter=20,
-                textColor=colors.HexColor("#34495E"),
-                alignment=1,
-            )
-        )
-
-        styles.add(
-            ParagraphStyle(
-                "TimeStamp",
-                parent=styles["Normal"],
-                fontSize=10,
-                textColor=colors.HexColor("#7F8C8D"),
-                alignment=1,
-            )
-        )
+        styles = _report_styles()
 
         class NumberedCanvas(canvas.Canvas):
-            def __init__(self, *args, **kwargs):
-                canvas.Canvas.__init__(self, *args, **kwargs)
-                self._saved_page_states = []
-
+            # The page total is only known once every page has been laid out.
+            # Rather than holding back a copy of the canvas state for each page
+            # until save(), every page references one shared form holding the
+            # total, and that form is filled in once at the end.
             def showPage(self):
-                self._saved_page_states.append(dict(self.__dict__))
-                self._startPage()
+                self.draw_page_number()
+                canvas.Canvas.showPage(self)
 
             def save(self):
-                num_pages = len(self._saved_page_states)
-                for state in self._saved_page_states:
-                    self.__dict__.update(state)
-                    self.draw_page_number(num_pages)
-                    canvas.Canvas.showPage(self)
+                self.beginForm("pageCount")
+                self.setFont("Helvetica", 9)
+                # showPage has already advanced past the last page
+                self.drawString(0, 0, str(self._pageNumber - 1))
+                self.endForm()
                 canvas.Canvas.save(self)
 
-            def draw_page_number(self, page_count):
+            def draw_page_number(self):
+                # Room for up to three digits of page total after "of"
+                total_width = self.stringWidth("000", "Helvetica", 9)
+                x = self._pagesize[0] - 36 - total_width
                 self.setFont("Helvetica", 9)
-                self.drawRightString(
-                    self._pagesize[0] - 36,
-                    36,
-                    f"Page {self._pageNumber} of {page_count}",
-                )
+                self.drawRightString(x, 36, f"Page {self._pageNumber} of ")
+                self.saveState()
+                self.translate(x, 36)
+                self.doForm("pageCount")
+                self.restoreState()
 
         elements = []
 
@@ -172,12 +310,10 @@ def export_to_pdf(monitor, export_path=None):
         elements.append(Spacer(1, 30))
 
         # Summary Statistics
-        event_counts = defaultdict(int)
-        for alert in alerts:
-            event_counts[alert[2]] += 1
+        event_counts = Counter(event_types)
 
         summary_data = [
-            ["Monitoring Period", f"{alerts[0][0]} to {alerts[-1][0]}"],
+            ["Monitoring Period", f"{raw_timestamps[0]} to {raw_timestamps[-1]}"],
             ["Total Events", str(len(alerts))],
             ["Created Files", str(event_counts.get("CREATED", 0))],
             ["Modified Files", str(event_counts.get("MODIFIED", 0))],
@@ -187,27 +323,7 @@ def export_to_pdf(monitor, export_path=None):
 
         # Enhanced Summary Table
         summary_table = Table(summary_data, colWidths=[2.5 * inch, 5 * inch])
-        summary_table.setStyle(
-            TableStyle(
-                [
-                    ("BACKGROUND", (0, 0), (0, -1), colors.HexColor("#F8F9FA")),
-                    ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#2C3E50")),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, -1), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, -1), 11),
-                    ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
-                    ("TOPPADDING", (0, 0), (-1, -1), 12),
-                    ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#E9ECEF")),
-                    (
-                        "ROWBACKGROUNDS",
-                        (0, 0),
-                        (-1, -1),
-                        [colors.HexColor("#FFFFFF"), colors.HexColor("#F8F9FA")],
-                    ),
-                    ("ALIGN", (1, 0), (1, -1), "RIGHT"),
-                ]
-            )
-        )
+        summary_table.setStyle(_SUMMARY_STYLE)
 
         elements.append(Paragraph("Summary Statistics", styles["SubTitle"]))
         elements.append(summary_table)
@@ -223,7 +339,7 @@ def export_to_pdf(monitor, export_path=None):
             pie.height = 150
 
             # Get data and calculate percentages
-            total_events = sum(event_counts.values())
+            total_events = len(alerts)
             formatted_labels = []
             for event_type, count in zip(event_counts.keys(), event_counts.values()):
                 percentage = (count / total_events) * 100
@@ -247,21 +363,20 @@ def export_to_pdf(monitor, export_path=None):
             drawing.add(pie)
             return drawing
 
-        def analyze_time_patterns(alerts):
-            # First, calculate the total time span
-            timestamps = [datetime.fromisoformat(alert[0]) for alert in alerts]
-            time_span = max(timestamps) - min(timestamps)
+        def analyze_time_patterns(timestamps):
+            # First, calculate the total time span; alerts come back from the
+            # database ORDER BY timestamp, so the ends of the list are min/max
+            time_span = timestamps[-1] - timestamps[0]
             total_minutes = time_span.total_seconds() / 60
 
             drawing = Drawing(400, 200)
             bar_chart = VerticalBarChart()
 
             # If monitoring period is less than 1 hour, use minute-based intervals
+            # Bucket with Counter over attrgetter so the whole histogram loop
+            # runs in C rather than one interpreted increment per alert
             if total_minutes < 60:
-                distribution = defaultdict(int)
-                for timestamp in timestamps:
-                    minute = timestamp.minute
-                    distribution[minute] += 1
+                distribution = Counter(map(attrgetter("minute"), timestamps))
 
                 bar_chart.data = [list(distribution.values())]
                 bar_chart.categoryAxis.categoryNames = [
@@ -270,10 +385,7 @@ def export_to_pdf(monitor, export_path=None):
                 y_label = "Events per Minute"
             else:
                 # Use original hourly distribution
-                hourly_distribution = defaultdict(int)
-                for timestamp in timestamps:
-                    hour = timestamp.hour
-                    hourly_distribution[hour] += 1
+                hourly_distribution = Counter(map(attrgetter("hour"), timestamps))
 
                 bar_chart.data = [list(hourly_distribution.values())]
                 bar_chart.categoryAxis.categoryNames = [
@@ -299,20 +411,13 @@ def export_to_pdf(monitor, export_path=None):
             return drawing
 
         # Create and add charts side by side
-        pie_chart = create_event_chart(alerts)
-        bar_chart = analyze_time_patterns(alerts)
+        pie_chart = _rasterize_chart(create_event_chart(alerts))
+        bar_chart = _rasterize_chart(analyze_time_patterns(timestamps))
 
         chart_table = Table(
             [[pie_chart, bar_chart]], colWidths=[4.5 * inch, 4.5 * inch]
         )
-        chart_table.setStyle(
-            TableStyle(
-                [
-                    ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                    ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ]
-            )
-        )
+        chart_table.setStyle(_CHART_STYLE)
 
         elements.append(Paragraph("Event Analysis", styles["SubTitle"]))
         elements.append(chart_table)
@@ -322,63 +427,58 @@ def export_to_pdf(monitor, export_path=None):
         elements.append(Paragraph("Detailed File Events", styles["SectionHeader"]))
 
         # Format the data with better timestamp and path handling
-        data = [
-            ["Timestamp", "File Path", "Event Type", "Details (User, SHA-256 hash)"]
+        header = [
+            "Timestamp",
+            "File Path",
+            "Event Type",
+            "Details (User, hash)",
         ]
-        for alert in alerts:
-            timestamp = datetime.fromisoformat(alert[0]).strftime("%Y-%m-%d %H:%M:%S")
-            file_path = os.path.basename(alert[1])  # Show only filename
-            formatted_details = (
-                f"User: {alert[3].split('User: ')[1].split(',')[0]}<br/>"
-            )
-            if "Hash changed" in alert[3]:
-                hash_data = alert[3].split("Hash changed: ")[1].split("->")
+        rows = []
+        # Looked up once here instead of on every row
+        normal_style = styles["Normal"]
+        for parsed_ts, file_path, event_type, detail in zip(
+            timestamps, file_paths, event_types, details
+        ):
+            timestamp = parsed_ts.strftime("%Y-%m-%d %H:%M:%S")
+            file_path = os.path.basename(file_path)  # Show only filename
+            match = _DETAIL_RE.search(detail)
+            formatted_details = f"User: {match.group(1)}<br/>"
+            if match.group(3) is not None:
+                algo = match.group(2) or "sha256"
                 old_hash = (
                     "None"
-                    if "None" in hash_data[0]
-                    else "<br/>".join(wrap(hash_data[0], 32))
+                    if match.group(3) == "None"
+                    else "<br/>".join(_HASH_LINE_RE.findall(match.group(3)))
+                )
+                new_hash = "<br/>".join(_HASH_LINE_RE.findall(match.group(4)))
+                formatted_details += (
+                    f"{_HASH_NAMES.get(algo, algo)} hash changed:<br/>"
+                    f"{old_hash} -><br/>{new_hash}"
                 )
-                new_hash = "<br/>".join(wrap(hash_data[1], 32))
-                formatted_details += f"Hash changed:<br/>{old_hash} -><br/>{new_hash}"
 
-            data.append(
+            rows.append(
                 [
                     timestamp,
-                    Paragraph(file_path, styles["Normal"]),
-                    alert[2],
-                    Paragraph(formatted_details, styles["Normal"]),
+                    Paragraph(file_path, normal_style),
+                    event_type,
+                    Paragraph(formatted_details, normal_style),
                 ]
             )
 
-        event_table = Table(
-            data, colWidths=[1.2 * inch, 2.5 * inch, 1.2 * inch, None], repeatRows=1
-        )
-
-        event_table.setStyle(
-            TableStyle(
-                [
-                    # Header
-                    ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2C3E50")),
-                    ("TEXTCOLOR", (0, 0), (-1, 0), colors.white),
-                    # Alternating rows
-                    (
-                        "ROWBACKGROUNDS",
-                        (0, 1),
-                        (-1, -1),
-                        [colors.HexColor("#FFFFFF"), colors.HexColor("#F8F9FA")],
-                    ),
-                    ("GRID", (0, 0), (-1, -1), 0.5, colors.HexColor("#E9ECEF")),
-                    ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                    ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                    ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                    ("FONTSIZE", (0, 0), (-1, 0), 10),
-                    ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                    ("TOPPADDING", (0, 0), (-1, 0), 12),
-                ]
+        # Lay the events out as a series of bounded LongTables so table layout
+        # cost stays linear in the number of alerts; each chunk repeats the
+        # header and flows on naturally from the previous one
+        for start in range(0, len(rows), DETAIL_TABLE_CHUNK_ROWS):
+            if start:
+                elements.append(Spacer(1, 6))
+            event_table = LongTable(
+                [header] + rows[start : start + DETAIL_TABLE_CHUNK_ROWS],
+                colWidths=[1.2 * inch, 2.5 * inch, 1.2 * inch, None],
+                repeatRows=1,
+                splitByRow=1,
             )
-        )
-
-        elements.append(event_table)
+            event_table.setStyle(_DETAIL_STYLE)
+            elements.append(event_table)
 
         # Generate PDF with page numbers
         doc.build(elements, canvasmaker=NumberedCanvas)
@@ -390,6 +490,24 @@ def export_to_pdf(monitor, export_path=None):
         return False
 
 
+def export_both(monitor):
+    """Export the logs as CSV and PDF at the same time"""
+    try:
+        # Read the alerts once for both exports. reportlab holds the GIL, so
+        # the PDF is built in another process while the CSV is written here.
+        alerts = monitor.db.get_all_alerts()
+        csv_path = get_export_path("csv")
+        pdf_path = get_export_path("pdf")
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            pdf_future = executor.submit(_write_pdf, alerts, pdf_path)
+            csv_ok = _write_csv([alerts], csv_path)
+            pdf_ok = pdf_future.result()
+        return csv_ok and pdf_ok
+    except Exception as e:
+        console.print(f"[red]Error during export: {str(e)}[/red]")
+        return False
+
+
 def export_logs(monitor):
     """Handle log export to either CSV or PDF"""
     try:
@@ -7,11 +7,22 @@ from rich.console import Console
 
 console = Console()
 
+# Maps every possible byte onto the alphanumeric alphabet for random content
+_ALPHABET = (string.ascii_letters + string.digits).encode()
+_CONTENT_TABLE = bytes(_ALPHABET[b % len(_ALPHABET)] for b in range(256))
+
 
 class FIMTester:
     def __init__(self, test_dir):
         self.test_dir = test_dir
         self.created_files = []
+        # The operations run_test_sequence picks from uniformly each tick
+        self._ops = (
+            self.create_random_file,
+            self.modify_random_file,
+            self.rename_random_file,
+            self.delete_random_file,
+        )
 
         # Create test directory if it doesn't exist
         if not os.path.exists(test_dir):
@@ -19,11 +30,9 @@ class FIMTester:
 
     def generate_random_content(self):
         """Generate random text content"""
-        return "".join(
-            random.choices(
-                string.ascii_letters + string.digits, k=random.randint(50, 200)
-            )
-        )
+        # Random bytes translated into the alphabet in C, no per-character loop
+        n = random.randint(50, 200)
+        return os.urandom(n).translate(_CONTENT_TABLE).decode("ascii")
 
     def create_random_file(self):
         """Create a new file with random content"""
@@ -39,52 +48,67 @@ class FIMTester:
         console.print(f"[green]Created: {filepath}[/green]")
         return filepath
 
+    def _forget_file(self, idx):
+        """Stop tracking the file at idx (swap with the last entry, then pop)"""
+        self.created_files[idx] = self.created_files[-1]
+        self.created_files.pop()
+
     def modify_random_file(self):
         """Modify a random existing file"""
         if not self.created_files:
             return None
 
-        target_file = random.choice(self.created_files)
-        if os.path.exists(target_file):
-            with open(target_file, "a") as f:
+        idx = random.randrange(len(self.created_files))
+        target_file = self.created_files[idx]
+        try:
+            # "r+" fails on a missing file instead of recreating it like "a"
+            with open(target_file, "r+") as f:
+                f.seek(0, os.SEEK_END)
                 f.write("\n" + self.generate_random_content())
-            console.print(f"[blue]Modified: {target_file}[/blue]")
-            return target_file
-        return None
+        except FileNotFoundError:
+            self._forget_file(idx)
+            return None
+        console.print(f"[blue]Modified: {target_file}[/blue]")
+        return target_file
 
     def rename_random_file(self):
         """Rename a random existing file"""
         if not self.created_files:
             return None
 
-        source_file = random.choice(self.created_files)
-        if os.path.exists(source_file):
-            # Randomly choose between renaming with same or different extension
-            if random.choice([True, False]):
-                new_name = f"renamed_{datetime.now().strftime('%H%M%S')}_{random.randint(1000, 9999)}.txt"
-            else:
-                new_name = f"renamed_{datetime.now().strftime('%H%M%S')}_{random.randint(1000, 9999)}.log"
+        idx = random.randrange(len(self.created_files))
+        source_file = self.created_files[idx]
+        # Randomly choose between renaming with same or different extension
+        if random.choice([True, False]):
+            new_name = f"renamed_{datetime.now().strftime('%H%M%S')}_{random.randint(1000, 9999)}.txt"
+        else:
+            new_name = f"renamed_{datetime.now().strftime('%H%M%S')}_{random.randint(1000, 9999)}.log"
 
-            new_path = os.path.join(self.test_dir, new_name)
+        new_path = os.path.join(self.test_dir, new_name)
+        try:
             os.rename(source_file, new_path)
-            self.created_files.remove(source_file)
-            self.created_files.append(new_path)
-            console.print(f"[yellow]Renamed: {source_file} -> {new_path}[/yellow]")
-            return new_path
-        return None
+        except FileNotFoundError:
+            self._forget_file(idx)
+            return None
+        self.created_files[idx] = new_path
+        console.print(f"[yellow]Renamed: {source_file} -> {new_path}[/yellow]")
+        return new_path
 
     def delete_random_file(self):
         """Delete a random existing file"""
         if not self.created_files:
             return None
 
-        target_file = random.choice(self.created_files)
-        if os.path.exists(target_file):
+        idx = random.randrange(len(self.created_files))
+        target_file = self.created_files[idx]
+        try:
             os.remove(target_file)
-            self.created_files.remove(target_file)
-            console.print(f"[red]Deleted: {target_file}[/red]")
-            return target_file
-        return None
+        except FileNotFoundError:
+            self._forget_file(idx)
+            return None
+        self._forget_file(idx)
+        console.print(f"[red]Deleted: {target_file}[/red]")
+        return target_file
 
     def run_test_sequence(self, duration_seconds=60, interval_seconds=5):
         """Run a sequence of random file operations"""
@@ -94,18 +118,8 @@ class FIMTester:
         end_time = time.time() + duration_seconds
 
         while time.time() < end_time:
-            # Randomly choose an operation
-            operation = random.choice(
-                [
-                    self.create_random_file,
-                    self.modify_random_file,
-                    self.rename_random_file,
-                    self.delete_random_file,
-                ]
-            )
-
-            # Execute the chosen operation
-            operation()
+            # Randomly choose and execute an operation
+            self._ops[int(random.random() * len(self._ops))]()
 
             # Wait for the specified interval
             time.sleep(interval_seconds)